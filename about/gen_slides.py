@@ -14,15 +14,23 @@ hosted anywhere as a static page.
 from __future__ import annotations
 
 import argparse
+import mmap
+import os
+import re
 import sys
 from pathlib import Path
 from textwrap import dedent
 
-from rich import print as rprint
-
 APP_NAME = "gen_slides"
 DESCRIPTION = "Generate HTML slides from Markdown using Remark.js"
 
+# Computed once; dedent scans the docstring to find the common indent.
+_EPILOG = dedent(__doc__ or "")
+
+# When output is piped, rich's markup parsing (and its import) is wasted
+# work, so the print helpers fall back to plain writes.
+_IS_TTY = sys.stdout.isatty()
+
 HTML_TEMPLATE = """\
 <!DOCTYPE html>
 <html lang="en">
@@ -165,24 +173,51 @@ HTML_TEMPLATE = """\
 </html>
 """
 
-
-def escape_html_textarea(content: str) -> str:
+# The template above uses str.format-style placeholders (with doubled braces
+# around the CSS/JS blocks). Pre-process and encode it once at import time so
+# each run does two cheap bytes.replace calls instead of re-parsing the whole
+# template with the format machinery. The NUL-delimited slots cannot collide
+# with template or user content.
+_TITLE_SLOT = b"\x00TITLE\x00"
+_MD_SLOT = b"\x00MD\x00"
+_TEMPLATE_PRE = (
+    HTML_TEMPLATE.replace("{title}", "\x00TITLE\x00")
+    .replace("{markdown_content}", "\x00MD\x00")
+    .replace("{{", "{")
+    .replace("}}", "}")
+    .encode("utf-8")
+)
+
+# Split the template at the two slots so output can be streamed to disk in
+# chunks (head, title, mid, markdown, tail) without assembling the full
+# document in memory first.
+_TMPL_HEAD, _rest = _TEMPLATE_PRE.split(_TITLE_SLOT, 1)
+_TMPL_MID, _TMPL_TAIL = _rest.split(_MD_SLOT, 1)
+del _rest
+
+
+def escape_html_textarea(content: bytes | mmap.mmap) -> bytes | mmap.mmap:
     """Escape content for embedding in HTML textarea."""
-    # Only need to escape </textarea> if it appears in content
-    return content.replace("</textarea>", "&lt;/textarea&gt;")
+    # Only need to escape </textarea> if it appears in content. The find
+    # check stops at the first hit and allocates nothing on a miss (the
+    # common case), so most inputs pass through untouched.
+    if content.find(b"</textarea>") == -1:
+        return content
+    return bytes(content).replace(b"</textarea>", b"&lt;/textarea&gt;")
+
+
+# Matches a '* * *' horizontal-rule line, with optional surrounding whitespace
+# (tolerating a CRLF line ending).
+_SEP_RE = re.compile(rb"(?m)^[ \t]*\* \* \*[ \t]*\r?$")
+
+# Matches the first '# ' heading line; group 1 is the heading text
+# (excluding any CRLF line ending).
+_TITLE_RE = re.compile(rb"(?m)^[ \t]*# +(\S.*?)[ \t]*\r?$")
 
 
-def convert_separators(content: str) -> str:
+def convert_separators(content: bytes | mmap.mmap) -> bytes:
     """Convert '* * *' horizontal rules to Remark's '---' slide separators."""
-    lines = content.split("\n")
-    result = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped == "* * *":
-            result.append("---")
-        else:
-            result.append(line)
-    return "\n".join(result)
+    return _SEP_RE.sub(b"---", content)
 
 
 def generate_slides(
@@ -201,43 +236,50 @@ def generate_slides(
     Returns:
         Path to the generated HTML file
     """
-    if not input_path.exists():
+    if not os.path.exists(input_path):
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    markdown_content = input_path.read_text(encoding="utf-8")
-
-    # Convert * * * separators to --- for Remark
-    markdown_content = convert_separators(markdown_content)
-
-    # Determine title from first heading if not provided
-    if title is None:
-        for line in markdown_content.split("\n"):
-            line = line.strip()
-            if line.startswith("# "):
-                title = line[2:].strip()
-                break
-        if title is None:
-            title = input_path.stem
-
-    # Determine output path
-    if output_path is None:
-        output_path = input_path.with_suffix(".html")
-
-    # Escape content and generate HTML
-    escaped_content = escape_html_textarea(markdown_content)
-    html_content = HTML_TEMPLATE.format(
-        title=title,
-        markdown_content=escaped_content,
-    )
-
-    output_path.write_text(html_content, encoding="utf-8")
+    # Memory-map the input so the regex scans read straight from the OS page
+    # cache; a copy is only materialized if separators need rewriting. An
+    # empty file cannot be mapped, so fall back to b"" for that case.
+    with open(input_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        try:
+            markdown_content: bytes | mmap.mmap = mm if mm is not None else b""
+
+            # Convert * * * separators to --- for Remark
+            if mm is not None and _SEP_RE.search(mm) is not None:
+                markdown_content = convert_separators(mm)
+
+            # Determine title from first heading if not provided
+            if title is None:
+                m = _TITLE_RE.search(markdown_content)
+                title = m.group(1).decode("utf-8") if m else input_path.stem
+
+            # Determine output path
+            if output_path is None:
+                output_path = input_path.with_suffix(".html")
+
+            # Escape content and stream the HTML to disk in template chunks,
+            # so peak memory is bounded by the write buffer, not output size
+            escaped_content = escape_html_textarea(markdown_content)
+            with open(output_path, "wb", buffering=1 << 20) as out:
+                out.write(_TMPL_HEAD)
+                out.write(title.encode("utf-8"))
+                out.write(_TMPL_MID)
+                out.write(escaped_content)
+                out.write(_TMPL_TAIL)
+        finally:
+            if mm is not None:
+                mm.close()
     return output_path
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=DESCRIPTION,
-        epilog=dedent(__doc__ or ""),
+        epilog=_EPILOG,
     )
     parser.add_argument(
         "input",
@@ -260,14 +302,30 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def rprint(*args: object) -> None:
+    """Print via rich, importing it lazily so bare argparse paths (--help,
+    usage errors) don't pay rich's import cost."""
+    from rich import print as rich_print
+
+    rich_print(*args)
+
+
+def _emit(markup: str, plain: str) -> None:
+    """Render markup via rich on a TTY; write plain text when piped."""
+    if _IS_TTY:
+        rprint(markup)
+    else:
+        sys.stdout.write(plain + "\n")
+
+
 def print_success(message: str) -> None:
     """Print a success message with green checkmark."""
-    rprint(f"[green]✔︎[/green] {message}")
+    _emit(f"[green]✔︎[/green] {message}", f"✔︎ {message}")
 
 
 def print_error(message: str) -> None:
     """Print an error message with red label."""
-    rprint(f"[red]Error:[/red] {message}")
+    _emit(f"[red]Error:[/red] {message}", f"Error: {message}")
 
 
 def main() -> None:
@@ -281,13 +339,16 @@ def main() -> None:
             title=args.title,
         )
         print_success(f"Generated: {output_path}")
-        rprint(f"  Open in browser: file://{output_path.resolve()}")
+        if _IS_TTY:
+            # resolve() stats every path component; only worth it when a
+            # human is there to click the link
+            rprint(f"  Open in browser: file://{output_path.resolve()}")
     except KeyboardInterrupt:
-        rprint()
-        rprint("[yellow]Cancelled[/yellow]")
+        _emit("", "")
+        _emit("[yellow]Cancelled[/yellow]", "Cancelled")
         sys.exit(130)
     except Exception as e:
-        rprint()
+        _emit("", "")
         print_error(str(e))
         sys.exit(1)
 
@@ -2,26 +2,27 @@
 Command implementations for speculate CLI.
 
 Each command is a function with a docstring that serves as CLI help.
-Only copier is lazy-imported (it's a large package).
+Heavy imports (copier, yaml, json, shutil, prettyfmt, strif) are deferred
+to the functions that need them so fast paths like --help don't pay for
+them.
 """
 
 from __future__ import annotations
 
-import json
+import fnmatch
+import functools
+import os
 import re
-import shutil
-from datetime import UTC, datetime
-from importlib.metadata import version
+import stat
+import sys
 from importlib.resources import files
 from pathlib import Path
 from typing import Any, cast
 
-import yaml
-from prettyfmt import fmt_count_items, fmt_size_human
 from rich import print as rprint
-from strif import atomic_output_file
 
 from speculate.cli.cli_ui import (
+    batched_output,
     print_cancelled,
     print_detail,
     print_error,
@@ -34,17 +35,77 @@ from speculate.cli.cli_ui import (
     print_warning,
 )
 
+# Parsed-YAML cache: path -> ((mtime_ns, size), parsed dict). The answers and
+# settings files get read by several steps of one command run; the signature
+# check means an unchanged file costs a stat instead of a re-parse.
+_yaml_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 def _load_yaml(path: Path) -> dict[str, Any]:
-    """Load a YAML file and return a dictionary."""
-    with open(path) as f:
-        result = yaml.safe_load(f)
-    return cast(dict[str, Any], result) if isinstance(result, dict) else {}
+    """Load a YAML file and return a dictionary.
+
+    Cached by (mtime_ns, size); callers must treat the result as read-only
+    (copy before mutating).
+    """
+    key = str(path)
+    st = os.stat(path)
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+
+    import yaml  # Lazy import - only status/install paths touch YAML
+
+    # libyaml's C loader parses several times faster when available
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    result = yaml.load(path.read_bytes(), Loader=loader)
+    parsed = cast(dict[str, Any], result) if isinstance(result, dict) else {}
+    _yaml_cache[key] = (sig, parsed)
+    return parsed
+
+
+@functools.cache
+def _json_codec() -> tuple[Any, Any]:
+    """(loads, dumps) pair: orjson's C codec when installed (the `fast`
+    extra), stdlib json otherwise. dumps produces 2-space-indented text with
+    a trailing newline either way. Resolved lazily so JSON-free paths don't
+    pay the import."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        def dumps(obj: Any) -> str:
+            return json.dumps(obj, indent=2) + "\n"
+
+        return json.loads, dumps
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode() + "\n"
+
+    return orjson.loads, dumps
 
 
 # Package name for version lookup (PyPI package name)
 PACKAGE_NAME = "speculate-cli"
 
+
+@functools.cache
+def _cli_version() -> str:
+    """Installed CLI version, or "unknown" outside an installed package.
+
+    Cached for the process lifetime: the metadata lookup walks sys.path and
+    parses .dist-info files, which is slow on cold filesystems. The import is
+    deferred for the same reason.
+    """
+    from importlib.metadata import version
+
+    try:
+        return version(PACKAGE_NAME)
+    except Exception:
+        return "unknown"
+
+
 # Speculate configuration paths (all under .speculate/)
 SPECULATE_DIR = ".speculate"
 COPIER_ANSWERS_FILE = f"{SPECULATE_DIR}/copier-answers.yml"
@@ -71,25 +132,32 @@ def init(
       speculate init --overwrite  # Overwrite without confirmation
       speculate init --ref v1.0.0 # Use specific tag/commit
     """
+    import shutil
+
     import copier  # Lazy import - large package
+    from prettyfmt import fmt_count_items, fmt_size_human
 
     dst = Path(destination).resolve()
     docs_path = dst / "docs"
 
     print_header("Initializing Speculate docs in:", dst)
 
+    # When stdin isn't a terminal (CI, scripted runs), input() would block or
+    # read garbage; skip prompting and take each prompt's default answer.
+    interactive = sys.stdin.isatty()
+
     if docs_path.exists() and not overwrite:
         print_note(
             f"{docs_path} already exists", "Use `speculate update` to preserve local changes."
         )
-        response = input("Reinitialize anyway? [y/N] ").strip().lower()
+        response = input("Reinitialize anyway? [y/N] ").strip().lower() if interactive else "n"
         if response != "y":
             print_cancelled()
             raise SystemExit(0)
 
     print_header("Docs will be copied to:", f"{docs_path}/")
 
-    if not overwrite:
+    if not overwrite and interactive:
         response = input("Proceed? [Y/n] ").strip().lower()
         if response == "n":
             print_cancelled()
@@ -188,6 +256,7 @@ def install(
     include: list[str] | None = None,
     exclude: list[str] | None = None,
     force: bool = False,
+    root: Path | None = None,
 ) -> None:
     """Generate tool configs for Cursor, Claude Code, and Codex.
 
@@ -217,8 +286,11 @@ def install(
       speculate install --include "general-*.md"
       speculate install --exclude "convex-*.md"
       speculate install --force
+
+    `root` overrides the project directory (defaults to the current working
+    directory); useful for tests and embedding.
     """
-    cwd = Path.cwd()
+    cwd = root if root is not None else Path.cwd()
     docs_path = cwd / "docs"
 
     if not docs_path.exists():
@@ -230,31 +302,46 @@ def install(
 
     print_header("Installing tool configurations...", cwd)
 
-    # .speculate/settings.yml — track install metadata
-    _update_speculate_settings(cwd)
-
-    claude_md = cwd / "CLAUDE.md"
-    agents_md = cwd / "AGENTS.md"
+    from concurrent.futures import ThreadPoolExecutor
+
+    # .speculate/settings.yml — track install metadata. The settings write is
+    # independent of the steps below and returns a did-write flag instead of
+    # printing, so it runs in the background while the header/symlink work
+    # proceeds; its success line is printed on the main thread after the
+    # result is collected, keeping output deterministic.
+    executor = ThreadPoolExecutor(max_workers=1)
+    settings_future = executor.submit(_update_speculate_settings, cwd)
+
+    # Buffer the per-stage output lines and render them in one pass at the
+    # end of the block (see batched_output)
+    with batched_output():
+        claude_md = cwd / "CLAUDE.md"
+        agents_md = cwd / "AGENTS.md"
+
+        # Handle CLAUDE.md and AGENTS.md setup
+        # If CLAUDE.md doesn't exist, create it as a symlink to AGENTS.md.
+        # lexists is one lstat and covers dangling symlinks too.
+        if not os.path.lexists(claude_md):
+            # First ensure AGENTS.md exists with the header
+            _ensure_speculate_header(agents_md)
+            # Then create CLAUDE.md as a symlink to AGENTS.md
+            claude_md.symlink_to("AGENTS.md")
+            print_success("Created CLAUDE.md -> AGENTS.md symlink")
+        else:
+            # CLAUDE.md exists (as file or symlink)
+            # _ensure_speculate_header handles symlinks by skipping them
+            _ensure_speculate_header(claude_md)
+            _ensure_speculate_header(agents_md)
 
-    # Handle CLAUDE.md and AGENTS.md setup
-    # If CLAUDE.md doesn't exist, create it as a symlink to AGENTS.md
-    if not claude_md.exists() and not claude_md.is_symlink():
-        # First ensure AGENTS.md exists with the header
-        _ensure_speculate_header(agents_md)
-        # Then create CLAUDE.md as a symlink to AGENTS.md
-        claude_md.symlink_to("AGENTS.md")
-        print_success("Created CLAUDE.md -> AGENTS.md symlink")
-    else:
-        # CLAUDE.md exists (as file or symlink)
-        # _ensure_speculate_header handles symlinks by skipping them
-        _ensure_speculate_header(claude_md)
-        _ensure_speculate_header(agents_md)
+        # .cursor/rules/
+        _setup_cursor_rules(cwd, include=include, exclude=exclude, force=force)
 
-    # .cursor/rules/
-    _setup_cursor_rules(cwd, include=include, exclude=exclude, force=force)
+        # .claude/ hooks
+        _setup_claude_hooks(cwd, force=force)
 
-    # .claude/ hooks
-    _setup_claude_hooks(cwd, force=force)
+    if settings_future.result():
+        print_success(f"Updated {SETTINGS_FILE}")
+    executor.shutdown()
 
     rprint()
     print_success("Tool configs installed!")
@@ -276,67 +363,72 @@ def status() -> None:
     Examples:
       speculate status
     """
+    from prettyfmt import fmt_count_items, fmt_size_human  # Lazy import
+
     cwd = Path.cwd()
     has_errors = False
 
-    print_header("Speculate Status", cwd)
-
-    # Check copier answers file (required for update)
-    answers_file = cwd / COPIER_ANSWERS_FILE
-    if answers_file.exists():
-        answers = _load_yaml(answers_file)
-        commit = answers.get("_commit", "unknown")
-        src = answers.get("_src_path", "unknown")
-        print_success(f"Template version: {commit}")
-        print_detail(f"Source: {src}")
-    else:
-        print_error_item(
-            f"{COPIER_ANSWERS_FILE} missing (required!)",
-            "Run `speculate init` to initialize docs.",
-        )
-        has_errors = True
-
-    # Check settings file
-    settings_file = cwd / SETTINGS_FILE
-    if settings_file.exists():
-        settings = _load_yaml(settings_file)
-        last_update = settings.get("last_update", "unknown")
-        cli_version = settings.get("last_cli_version", "unknown")
-        print_success(f"Last install: {last_update} (CLI {cli_version})")
-    else:
-        print_info(f"{SETTINGS_FILE} not found")
-
-    # Check docs/
-    docs_path = cwd / "docs"
-    if docs_path.exists():
-        file_count, total_size = _get_dir_stats(docs_path)
-        print_success(
-            f"docs/ exists ({fmt_count_items(file_count, 'file')}, {fmt_size_human(total_size)})"
-        )
-    else:
-        print_missing("docs/ not found")
+    # One rich render for the whole report instead of a markup parse and
+    # flush per line
+    with batched_output():
+        print_header("Speculate Status", cwd)
+
+        # Check copier answers file (required for update)
+        answers_file = cwd / COPIER_ANSWERS_FILE
+        if answers_file.exists():
+            answers = _load_yaml(answers_file)
+            commit = answers.get("_commit", "unknown")
+            src = answers.get("_src_path", "unknown")
+            print_success(f"Template version: {commit}")
+            print_detail(f"Source: {src}")
+        else:
+            print_error_item(
+                f"{COPIER_ANSWERS_FILE} missing (required!)",
+                "Run `speculate init` to initialize docs.",
+            )
+            has_errors = True
+
+        # Check settings file
+        settings_file = cwd / SETTINGS_FILE
+        if settings_file.exists():
+            settings = _load_yaml(settings_file)
+            last_update = settings.get("last_update", "unknown")
+            cli_version = settings.get("last_cli_version", "unknown")
+            print_success(f"Last install: {last_update} (CLI {cli_version})")
+        else:
+            print_info(f"{SETTINGS_FILE} not found")
+
+        # Check docs/
+        docs_path = cwd / "docs"
+        if docs_path.exists():
+            file_count, total_size = _get_dir_stats(docs_path)
+            print_success(
+                f"docs/ exists ({fmt_count_items(file_count, 'file')}, {fmt_size_human(total_size)})"
+            )
+        else:
+            print_missing("docs/ not found")
 
-    # Check development.md (required)
-    dev_md = cwd / "docs" / "development.md"
-    if dev_md.exists():
-        print_success("docs/development.md exists")
-    else:
-        print_error_item(
-            "docs/development.md missing (required!)",
-            "Create this file using docs/project/development.sample.md as a template.",
-        )
-        has_errors = True
-
-    # Check tool configs
-    for name, path in [
-        ("CLAUDE.md", cwd / "CLAUDE.md"),
-        ("AGENTS.md", cwd / "AGENTS.md"),
-        (".cursor/rules/", cwd / ".cursor" / "rules"),
-    ]:
-        if path.exists():
-            print_success(f"{name} exists")
+        # Check development.md (required)
+        dev_md = cwd / "docs" / "development.md"
+        if dev_md.exists():
+            print_success("docs/development.md exists")
         else:
-            print_info(f"{name} not configured")
+            print_error_item(
+                "docs/development.md missing (required!)",
+                "Create this file using docs/project/development.sample.md as a template.",
+            )
+            has_errors = True
+
+        # Check tool configs
+        for name, path in [
+            ("CLAUDE.md", cwd / "CLAUDE.md"),
+            ("AGENTS.md", cwd / "AGENTS.md"),
+            (".cursor/rules/", cwd / ".cursor" / "rules"),
+        ]:
+            if path.exists():
+                print_success(f"{name} exists")
+            else:
+                print_info(f"{name} not configured")
 
     rprint()
 
@@ -347,21 +439,27 @@ def status() -> None:
 # Helper functions
 
 
-def _update_speculate_settings(project_root: Path) -> None:
-    """Create or update .speculate/settings.yml with install metadata."""
+def _update_speculate_settings(project_root: Path) -> bool:
+    """Create or update .speculate/settings.yml with install metadata.
+
+    Returns True if the file was (re)written. Prints nothing itself so it is
+    safe to run on a worker thread (see install); the caller reports success.
+    """
+    from datetime import UTC, datetime
+
+    from strif import atomic_output_file  # Lazy import
+
     settings_dir = project_root / SPECULATE_DIR
     settings_dir.mkdir(parents=True, exist_ok=True)
     settings_file = project_root / SETTINGS_FILE
 
     # Read existing settings
-    settings: dict[str, Any] = _load_yaml(settings_file) if settings_file.exists() else {}
+    existing: dict[str, Any] = _load_yaml(settings_file) if settings_file.exists() else {}
+    settings = dict(existing)
 
     # Update with current info
-    settings["last_update"] = datetime.now(UTC).isoformat()
-    try:
-        settings["last_cli_version"] = version(PACKAGE_NAME)
-    except Exception:
-        settings["last_cli_version"] = "unknown"
+    settings["last_update"] = datetime.now(UTC).isoformat(timespec="seconds")
+    settings["last_cli_version"] = _cli_version()
 
     # Get docs version from copier answers file if available
     answers_file = project_root / COPIER_ANSWERS_FILE
@@ -369,26 +467,113 @@ def _update_speculate_settings(project_root: Path) -> None:
         answers = _load_yaml(answers_file)
         settings["last_docs_version"] = answers.get("_commit", "unknown")
 
+    # If nothing but the timestamp changed, bump the mtime instead of paying
+    # for a serialize + atomic rename on every repeated install.
+    if existing and {k: v for k, v in settings.items() if k != "last_update"} == {
+        k: v for k, v in existing.items() if k != "last_update"
+    }:
+        os.utime(settings_file)
+        return False
+
+    import yaml  # Lazy import - only status/install paths touch YAML
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    # encoding="utf-8" makes the dumper emit bytes directly, skipping the
+    # str round-trip and re-encode that write_text would do; sort_keys=False
+    # keeps the insertion order we build above without paying for a sort.
+    dumped = yaml.dump(
+        settings, Dumper=dumper, default_flow_style=False, sort_keys=False, encoding="utf-8"
+    )
     with atomic_output_file(settings_file) as temp_path:
-        Path(temp_path).write_text(yaml.dump(settings, default_flow_style=False))
-    print_success(f"Updated {SETTINGS_FILE}")
+        temp_path.write_bytes(dumped)
+    return True
 
 
 def _get_dir_stats(path: Path) -> tuple[int, int]:
     """Return (file_count, total_bytes) for all files in a directory."""
+    # Count top-level files here and fan the subdirectory walks out to a
+    # small thread pool: scandir and stat release the GIL, so the threads
+    # overlap syscall latency and a big tree costs roughly its largest
+    # subtree instead of the sum of all of them.
+    file_count = 0
+    total_size = 0
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    file_count += 1
+                    total_size += entry.stat().st_size
+    except OSError:
+        return 0, 0
+
+    if len(subdirs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(subdirs))) as ex:
+            results = list(ex.map(_walk_stats, subdirs))
+    else:
+        results = [_walk_stats(d) for d in subdirs]
+    for sub_count, sub_size in results:
+        file_count += sub_count
+        total_size += sub_size
+    return file_count, total_size
+
+
+def _walk_stats(root: str) -> tuple[int, int]:
+    """(file_count, total_bytes) for one subtree."""
     file_count = 0
     total_size = 0
-    for f in path.rglob("*"):
-        if f.is_file():
-            file_count += 1
-            total_size += f.stat().st_size
+
+    if hasattr(os, "fwalk"):
+        # fwalk stats each name relative to an open directory fd, so the
+        # kernel resolves one component instead of re-walking the full path
+        # per file in deep trees. Pre-bound locals spare the interpreter a
+        # global/attribute lookup per file in this innermost loop.
+        _stat = os.stat
+        _isreg = stat.S_ISREG
+        for _dirpath, _dirnames, filenames, dirfd in os.fwalk(root):
+            for name in filenames:
+                try:
+                    st = _stat(name, dir_fd=dirfd)
+                except OSError:
+                    continue
+                if _isreg(st.st_mode):
+                    file_count += 1
+                    total_size += st.st_size
+        return file_count, total_size
+
+    # Fallback (no fwalk, e.g. Windows): iterative os.scandir walk; DirEntry
+    # carries type and stat info from the directory read, avoiding per-entry
+    # Path construction and extra stat syscalls.
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        file_count += 1
+                        total_size += entry.stat().st_size
+        except OSError:
+            continue
     return file_count, total_size
 
 
 SPECULATE_MARKER = "Speculate project structure"
+_SPECULATE_MARKER_BYTES = SPECULATE_MARKER.encode()
 SPECULATE_HEADER = f"""IMPORTANT: You MUST read ./docs/development.md and ./docs/docs-overview.md for project documentation.
 (This project uses {SPECULATE_MARKER}.)"""
 
+# Header byte blobs, encoded once: the bare header for prefix checks, the
+# body of a brand-new file, and the prefix prepended to existing content.
+_SPECULATE_HEADER_BYTES = SPECULATE_HEADER.encode()
+_SPECULATE_HEADER_FILE_BYTES = _SPECULATE_HEADER_BYTES + b"\n"
+_SPECULATE_HEADER_PREPEND_BYTES = _SPECULATE_HEADER_BYTES + b"\n\n"
+
 # Regex pattern to match the speculate header block wherever it appears in a file.
 # Uses re.MULTILINE so ^ matches start of any line (not just start of file).
 # Handles trailing whitespace and blank lines after the header.
@@ -407,27 +592,68 @@ def _ensure_speculate_header(path: Path) -> None:
     If file exists without marker, prepend the header.
     If file doesn't exist, create with just the header.
     """
+    from strif import atomic_output_file  # Lazy import
+
+    # One lstat covers the symlink and existence checks below (each Path
+    # predicate would be its own syscall).
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        st = None
+
     # Skip symlinks - only write to the actual target
-    if path.is_symlink():
+    if st is not None and stat.S_ISLNK(st.st_mode):
         target = path.resolve()
         print_info(f"{path.name} is a symlink to {target.name}, skipping")
         return
 
-    if path.exists():
-        content = path.read_text()
-        if SPECULATE_MARKER in content:
+    if st is not None:
+        # The header sits at the top, so in the steady-state idempotent case
+        # a bounded head read is enough to confirm the file is configured.
+        # 4096 matches the filesystem block size: one read covers the marker
+        # even when users have added a screenful of content above the header.
+        with open(path, "rb") as f:
+            head = f.read(4096)
+            # Freshly installed files begin with the header verbatim, so a
+            # single prefix memcmp accepts them before the substring scan.
+            if head.startswith(_SPECULATE_HEADER_BYTES) or _SPECULATE_MARKER_BYTES in head:
+                print_info(f"{path.name} already configured")
+                return
+            body = head + f.read()
+        if len(body) > len(head) and _SPECULATE_MARKER_BYTES in body:
+            # Marker somewhere past the head probe; still configured.
             print_info(f"{path.name} already configured")
             return
-        # Prepend header to existing content
-        new_content = SPECULATE_HEADER + "\n\n" + content
-        action = "Updated"
+        # Prepend with two binary writes through the buffered writer: no
+        # whole-file decode, str concat, or re-encode pass.
+        with atomic_output_file(path) as temp_path, open(temp_path, "wb") as out:
+            _ = out.write(_SPECULATE_HEADER_PREPEND_BYTES)
+            _ = out.write(body)
+        print_success(f"Updated {path.name}")
     else:
-        new_content = SPECULATE_HEADER + "\n"
-        action = "Created"
+        with atomic_output_file(path) as temp_path:
+            temp_path.write_bytes(_SPECULATE_HEADER_FILE_BYTES)
+        print_success(f"Created {path.name}")
+
 
-    with atomic_output_file(path) as temp_path:
-        Path(temp_path).write_text(new_content)
-    print_success(f"{action} {path.name}")
+def _has_marker(path: Path) -> bool:
+    """Check whether a file contains the speculate marker.
+
+    Memory-maps the file so the search runs over the OS page cache with no
+    bytes copy or UTF-8 decode; a missing file is the no-marker case rather
+    than a prior stat. Empty files can't be mapped and have no marker.
+    """
+    import mmap
+
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return False
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                return mm.find(_SPECULATE_MARKER_BYTES) != -1
+    except FileNotFoundError:
+        return False
 
 
 def _remove_speculate_header(path: Path) -> None:
@@ -437,15 +663,22 @@ def _remove_speculate_header(path: Path) -> None:
     If the file becomes empty after removal, deletes the file.
     If the file doesn't exist or has no header, does nothing.
     """
-    if not path.exists():
-        return
+    from strif import atomic_output_file  # Lazy import
 
-    content = path.read_text()
+    try:
+        content = path.read_text()
+    except FileNotFoundError:
+        return
     if SPECULATE_MARKER not in content:
         return
 
-    # Remove the header using regex
-    new_content = SPECULATE_HEADER_PATTERN.sub("", content)
+    # The header is normally at the top of the file, so try an anchored match
+    # and splice; fall back to a full-file regex scan only if it moved.
+    m = SPECULATE_HEADER_PATTERN.match(content)
+    if m:
+        new_content = content[m.end() :]
+    else:
+        new_content = SPECULATE_HEADER_PATTERN.sub("", content)
 
     # Check if file is now empty (or just whitespace)
     if not new_content.strip():
@@ -453,10 +686,48 @@ def _remove_speculate_header(path: Path) -> None:
         print_success(f"Removed {path.name} (was empty after header removal)")
     else:
         with atomic_output_file(path) as temp_path:
-            Path(temp_path).write_text(new_content)
+            temp_path.write_text(new_content)
         print_success(f"Removed speculate header from {path.name}")
 
 
+@functools.cache
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern to a regex, normalizing ** to * for simple
+    filename matching (fnmatch doesn't support **). Cached so each pattern
+    is translated once per process, not once per file checked."""
+    return re.compile(fnmatch.translate(pattern.replace("**", "*")))
+
+
+# Glob metacharacters; a pattern without any is a plain filename
+_GLOB_MAGIC = frozenset("*?[")
+
+
+def _glob_match(filename: str, pattern: str) -> bool:
+    """Match a filename against one glob pattern.
+
+    Literal patterns like "CLAUDE.md" skip the regex machinery entirely and
+    become a string compare.
+    """
+    if _GLOB_MAGIC.isdisjoint(pattern):
+        return filename == pattern
+    return _compile_glob(pattern).match(filename) is not None
+
+
+@functools.cache
+def _compile_glob_group(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """One alternation regex for a whole pattern list, so matching a name
+    against k patterns is a single C-level regex match instead of k Python
+    calls. Cached per pattern tuple."""
+    return re.compile("|".join(fnmatch.translate(p.replace("**", "*")) for p in patterns))
+
+
+def _match_group(filename: str, patterns: tuple[str, ...]) -> bool:
+    """Whether filename matches any pattern in the group."""
+    if len(patterns) == 1:
+        return _glob_match(filename, patterns[0])
+    return _compile_glob_group(patterns).match(filename) is not None
+
+
 def _matches_patterns(
     filename: str,
     include: list[str] | None,
@@ -469,26 +740,58 @@ def _matches_patterns(
       - `**` is treated same as `*` for simple filename matching
 
     Default behavior: include all if no include patterns specified.
+
+    Results are memoized (bounded), so re-checking the same filename against
+    the same pattern lists is a dict lookup rather than a regex match.
     """
-    import fnmatch
+    return _matches_patterns_cached(
+        filename,
+        tuple(include) if include else None,
+        tuple(exclude) if exclude else None,
+    )
 
-    # Normalize ** to * for fnmatch (which doesn't support **)
-    def normalize(pattern: str) -> str:
-        return pattern.replace("**", "*")
 
+@functools.lru_cache(maxsize=8192)
+def _matches_patterns_cached(
+    filename: str,
+    include: tuple[str, ...] | None,
+    exclude: tuple[str, ...] | None,
+) -> bool:
     # If include patterns specified, file must match at least one
-    if include:
-        if not any(fnmatch.fnmatch(filename, normalize(p)) for p in include):
-            return False
+    if include and not _match_group(filename, include):
+        return False
 
     # If exclude patterns specified, file must not match any
-    if exclude:
-        if any(fnmatch.fnmatch(filename, normalize(p)) for p in exclude):
-            return False
+    if exclude and _match_group(filename, exclude):
+        return False
 
     return True
 
 
+def _collect_agent_rules(project_root: Path) -> dict[str, tuple[Path, str]]:
+    """Collect agent-rules files, mapping stem -> (source_path, relative_dir).
+
+    Scans docs/general/agent-rules/ and docs/project/agent-rules/; project
+    rules take precedence over general rules of the same name, so the
+    project dir is scanned first and later scans skip names already seen.
+    Uses scandir plus a suffix check rather than glob, which would
+    fnmatch-compile the pattern and wrap every entry in a Path.
+    """
+    rules: dict[str, tuple[Path, str]] = {}
+    for relative_dir in ("docs/project/agent-rules", "docs/general/agent-rules"):
+        dir_path = project_root / relative_dir
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith(".md") and name[:-3] not in rules and entry.is_file():
+                        rules[name[:-3]] = (Path(entry.path), relative_dir)
+        except FileNotFoundError:
+            if relative_dir == "docs/general/agent-rules":
+                print_warning("docs/general/agent-rules/ not found")
+    return rules
+
+
 def _setup_cursor_rules(
     project_root: Path,
     include: list[str] | None = None,
@@ -509,54 +812,59 @@ def _setup_cursor_rules(
     cursor_dir = project_root / ".cursor" / "rules"
     cursor_dir.mkdir(parents=True, exist_ok=True)
 
-    general_rules_dir = project_root / "docs" / "general" / "agent-rules"
-    project_rules_dir = project_root / "docs" / "project" / "agent-rules"
-
     # Collect rules from both sources, project takes precedence
-    # Maps stem -> (source_path, relative_dir_for_symlink)
-    rules: dict[str, tuple[Path, str]] = {}
-
-    if general_rules_dir.exists():
-        for rule_file in general_rules_dir.glob("*.md"):
-            rules[rule_file.stem] = (rule_file, "docs/general/agent-rules")
-    else:
-        print_warning("docs/general/agent-rules/ not found")
-
-    if project_rules_dir.exists():
-        for rule_file in project_rules_dir.glob("*.md"):
-            # Project rules override general rules of same name
-            rules[rule_file.stem] = (rule_file, "docs/project/agent-rules")
+    rules = _collect_agent_rules(project_root)
 
     if not rules:
         print_warning("No agent-rules found, skipping Cursor setup")
         return
 
-    linked_count = 0
     skipped_by_pattern = 0
-    skipped_existing = 0
+    ops: list[tuple[Path, Path]] = []
+
+    # Targets are relative to .cursor/rules/; build each ../../<dir> base once
+    # rather than re-joining the path parts per rule
+    base_by_dir = {d: Path("..") / ".." / d for d in {rd for _, rd in rules.values()}}
 
-    for stem in sorted(rules.keys()):
-        rule_path, relative_dir = rules[stem]
+    # With no filter flags (the default install), skip pattern matching work
+    # in the loop entirely
+    filter_on = include is not None or exclude is not None
 
+    for stem, (rule_path, relative_dir) in sorted(rules.items()):
         # Check include/exclude patterns
-        if not _matches_patterns(rule_path.name, include, exclude):
+        if filter_on and not _matches_patterns(rule_path.name, include, exclude):
             skipped_by_pattern += 1
             continue
 
-        # Cursor requires .mdc extension
-        link_name = stem + ".mdc"
-        link_path = cursor_dir / link_name
+        # Cursor requires .mdc extension; create relative symlinks
+        link_path = cursor_dir / (stem + ".mdc")
+        ops.append((link_path, base_by_dir[relative_dir] / rule_path.name))
 
-        if link_path.exists() or link_path.is_symlink():
+    def _link(op: tuple[Path, Path]) -> bool:
+        """Create one symlink EAFP-style; returns False if an existing entry
+        was kept. The happy path is a single symlink syscall with no
+        existence probe."""
+        link_path, target = op
+        try:
+            link_path.symlink_to(target)
+        except FileExistsError:
             if not force:
-                skipped_existing += 1
-                continue
+                return False
             link_path.unlink()
+            link_path.symlink_to(target)
+        return True
+
+    # Each symlink syscall is independent and releases the GIL, so a small
+    # pool overlaps their latency on slow filesystems.
+    if len(ops) > 1:
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Create relative symlink
-        relative_target = Path("..") / ".." / relative_dir / rule_path.name
-        link_path.symlink_to(relative_target)
-        linked_count += 1
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(_link, ops))
+    else:
+        results = [_link(op) for op in ops]
+    linked_count = sum(results)
+    skipped_existing = len(ops) - linked_count
 
     # Build informative message
     msg_parts: list[str] = []
@@ -581,28 +889,32 @@ def _remove_cursor_rules(project_root: Path) -> None:
     Handles symlinks to both docs/general/agent-rules/ and docs/project/agent-rules/.
     """
     cursor_dir = project_root / ".cursor" / "rules"
-    if not cursor_dir.exists():
-        return
 
     removed_count = 0
-    for link_path in cursor_dir.glob("*.mdc"):
-        if link_path.is_symlink():
-            # Check if it points to our docs (or is broken)
-            try:
-                target = link_path.resolve()
-                # Remove if it points to docs/general/agent-rules/ or docs/project/agent-rules/ or is broken
-                target_str = str(target)
-                if (
-                    "docs/general/agent-rules" in target_str
-                    or "docs/project/agent-rules" in target_str
-                    or not target.exists()
-                ):
-                    link_path.unlink()
-                    removed_count += 1
-            except OSError:
-                # Broken symlink, remove it
-                link_path.unlink()
-                removed_count += 1
+    # scandir gives entry type from the directory read, so the .mdc symlink
+    # filter needs no per-entry glob match or extra stat
+    try:
+        with os.scandir(cursor_dir) as it:
+            links = [e.path for e in it if e.name.endswith(".mdc") and e.is_symlink()]
+    except FileNotFoundError:
+        return
+
+    for link in links:
+        # The immediate link target is enough to identify our links (install
+        # writes them as relative paths into the agent-rules dirs), so one
+        # readlink replaces a resolve() that stats every path component.
+        try:
+            target_str = os.readlink(link)
+        except OSError:
+            target_str = ""
+        # Remove if it points to docs/general/agent-rules/ or docs/project/agent-rules/ or is broken
+        if (
+            "docs/general/agent-rules" in target_str
+            or "docs/project/agent-rules" in target_str
+            or not os.path.exists(link)
+        ):
+            os.unlink(link)
+            removed_count += 1
 
     if removed_count > 0:
         print_success(f"Removed {removed_count} symlinks from .cursor/rules/")
@@ -617,6 +929,25 @@ def _get_claude_hooks_resource() -> Any:
     return files(CLAUDE_HOOKS_RESOURCE)
 
 
+@functools.cache
+def _claude_hook_scripts() -> tuple[tuple[str, str], ...]:
+    """(name, content) pairs for the packaged hook scripts.
+
+    Read once per process; resource reads go through the importlib.resources
+    traversal machinery, which is slow to repeat and never changes at runtime.
+    """
+    scripts_resource = _get_claude_hooks_resource().joinpath("scripts")
+    return tuple(
+        (f.name, f.read_text()) for f in scripts_resource.iterdir() if f.name.endswith(".sh")
+    )
+
+
+@functools.cache
+def _claude_hooks_config_text() -> str:
+    """Raw hooks.json resource text, read once per process."""
+    return _get_claude_hooks_resource().joinpath("hooks.json").read_text()
+
+
 def _setup_claude_hooks(project_root: Path, force: bool = False) -> None:
     """Set up .claude/ directory with hooks from resources.
 
@@ -627,7 +958,6 @@ def _setup_claude_hooks(project_root: Path, force: bool = False) -> None:
     Handles merging with existing settings.json (preserves user hooks).
     Never touches .claude/settings.local.json (user's local overrides).
     """
-    resource_dir = _get_claude_hooks_resource()
     claude_dir = project_root / ".claude"
     scripts_dir = claude_dir / "scripts"
     settings_file = claude_dir / "settings.json"
@@ -636,18 +966,14 @@ def _setup_claude_hooks(project_root: Path, force: bool = False) -> None:
     scripts_dir.mkdir(parents=True, exist_ok=True)
 
     # Copy all scripts from resources
-    scripts_resource = resource_dir.joinpath("scripts")
-    for script_file in scripts_resource.iterdir():
-        if script_file.name.endswith(".sh"):
-            dest_file = scripts_dir / script_file.name
-            script_content = script_file.read_text()
-            action = _copy_script_file(dest_file, script_content, force)
-            if action:
-                print_success(f".claude/scripts/{script_file.name}: {action}")
+    for script_name, script_content in _claude_hook_scripts():
+        dest_file = scripts_dir / script_name
+        action = _copy_script_file(dest_file, script_content, force)
+        if action:
+            print_success(f".claude/scripts/{script_name}: {action}")
 
     # Merge hooks.json into settings.json
-    hooks_resource = resource_dir.joinpath("hooks.json")
-    hooks_config = json.loads(hooks_resource.read_text())
+    hooks_config = _json_codec()[0](_claude_hooks_config_text())
     action = _merge_claude_settings(settings_file, hooks_config)
     if action:
         print_success(f".claude/settings.json: {action}")
@@ -655,6 +981,8 @@ def _setup_claude_hooks(project_root: Path, force: bool = False) -> None:
 
 def _copy_script_file(dest_file: Path, content: str, force: bool) -> str | None:
     """Copy a script file to destination. Returns action description or None if no change."""
+    from strif import atomic_output_file  # Lazy import
+
     if dest_file.exists():
         existing_content = dest_file.read_text()
         if existing_content == content:
@@ -666,13 +994,13 @@ def _copy_script_file(dest_file: Path, content: str, force: bool) -> str | None:
             return None
         # Force overwrite
         with atomic_output_file(dest_file) as temp_path:
-            Path(temp_path).write_text(content)
+            temp_path.write_text(content)
         dest_file.chmod(0o755)
         return "updated (forced)"
 
     # Create new script
     with atomic_output_file(dest_file) as temp_path:
-        Path(temp_path).write_text(content)
+        temp_path.write_text(content)
     dest_file.chmod(0o755)
     return "created"
 
@@ -682,12 +1010,17 @@ def _merge_claude_settings(settings_file: Path, hooks_to_add: dict[str, list[Any
 
     Returns action description or None if no change needed.
     """
+    from strif import atomic_output_file  # Lazy import
+
+    loads, dumps = _json_codec()
+
     settings: dict[str, Any]
     if settings_file.exists():
         try:
-            parsed = json.loads(settings_file.read_text())
+            parsed = loads(settings_file.read_text())
             settings = cast(dict[str, Any], parsed) if isinstance(parsed, dict) else {}
-        except json.JSONDecodeError:
+        except ValueError:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
             print_warning(".claude/settings.json has invalid JSON, skipping")
             return None
     else:
@@ -736,12 +1069,12 @@ def _merge_claude_settings(settings_file: Path, hooks_to_add: dict[str, list[Any
 
     was_new = not settings_file.exists()
     with atomic_output_file(settings_file) as temp_path:
-        Path(temp_path).write_text(json.dumps(settings, indent=2) + "\n")
+        temp_path.write_text(dumps(settings))
 
     return "created" if was_new else "updated hooks"
 
 
-def uninstall(force: bool = False) -> None:
+def uninstall(force: bool = False, root: Path | None = None) -> None:
     """Remove tool configs installed by speculate.
 
     Removes:
@@ -760,8 +1093,11 @@ def uninstall(force: bool = False) -> None:
     Examples:
       speculate uninstall           # Uninstall with confirmation
       speculate uninstall --force   # Uninstall without confirmation
+
+    `root` overrides the project directory (defaults to the current working
+    directory); useful for tests and embedding.
     """
-    cwd = Path.cwd()
+    cwd = root if root is not None else Path.cwd()
 
     print_header("Uninstalling Speculate tool configs...", cwd)
 
@@ -769,11 +1105,11 @@ def uninstall(force: bool = False) -> None:
     changes: list[str] = []
 
     claude_md = cwd / "CLAUDE.md"
-    if claude_md.exists() and SPECULATE_MARKER in claude_md.read_text():
+    if _has_marker(claude_md):
         changes.append("Remove speculate header from CLAUDE.md")
 
     agents_md = cwd / "AGENTS.md"
-    if agents_md.exists() and SPECULATE_MARKER in agents_md.read_text():
+    if _has_marker(agents_md):
         changes.append("Remove speculate header from AGENTS.md")
 
     cursor_rules = cwd / ".cursor" / "rules"
@@ -812,10 +1148,12 @@ def uninstall(force: bool = False) -> None:
     # Remove .cursor/rules/ symlinks
     _remove_cursor_rules(cwd)
 
-    # Remove .speculate/settings.yml
-    if settings_file.exists():
+    # Remove .speculate/settings.yml (EAFP: one unlink, no stat probe)
+    try:
         settings_file.unlink()
         print_success(f"Removed {SETTINGS_FILE}")
+    except FileNotFoundError:
+        pass
 
     rprint()
     print_success("Uninstall complete!")
@@ -7,6 +7,8 @@ consistent styling across the CLI.
 
 from __future__ import annotations
 
+from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path
 
 from rich import print as rprint
@@ -14,63 +16,96 @@ from rich import print as rprint
 # Standard indentation for continuation lines
 _INDENT = "  "
 
+# When set, print helpers append their markup here instead of rendering
+# immediately; batched_output() flushes it in a single rich print call.
+_batch: list[str] | None = None
+
+
+def _emit(markup: str) -> None:
+    global _batch
+    if _batch is not None:
+        _batch.append(markup)
+    else:
+        rprint(markup)
+
+
+@contextmanager
+def batched_output() -> Generator[None]:
+    """Collect print helper output and render it with one rich print call.
+
+    Commands that emit many lines in a burst (like `status`) otherwise pay
+    for a markup parse and stdout flush per line.
+    """
+    global _batch
+    if _batch is not None:
+        # Already batching (nested use); just continue the outer batch
+        yield
+        return
+    _batch = []
+    try:
+        yield
+    finally:
+        lines, _batch = _batch, None
+        if lines:
+            rprint("\n".join(lines))
+
 
 def print_header(title: str, path: Path | str | None = None) -> None:
     """Print a section header with optional path on a new indented line."""
-    rprint(f"\n[bold]{title}[/bold]")
+    _emit(f"\n[bold]{title}[/bold]")
     if path is not None:
-        rprint(f"{_INDENT}{path}")
-    rprint()
+        _emit(f"{_INDENT}{path}")
+    _emit("")
 
 
 def print_success(message: str) -> None:
     """Print a success message with green checkmark."""
-    rprint(f"[green]✔︎[/green] {message}")
+    _emit(f"[green]✔︎[/green] {message}")
 
 
 def print_error(message: str, detail: str | None = None) -> None:
     """Print an error message with red label and optional detail line."""
-    rprint(f"[red]Error:[/red] {message}")
+    _emit(f"[red]Error:[/red] {message}")
     if detail:
-        rprint(f"{_INDENT}{detail}")
+        _emit(f"{_INDENT}{detail}")
 
 
 def print_warning(message: str, detail: str | None = None) -> None:
     """Print a warning message with yellow label and optional detail line."""
-    rprint(f"[yellow]Warning:[/yellow] {message}")
+    _emit(f"[yellow]Warning:[/yellow] {message}")
     if detail:
-        rprint(f"{_INDENT}{detail}")
+        _emit(f"{_INDENT}{detail}")
 
 
 def print_note(message: str, detail: str | None = None) -> None:
     """Print a note message with yellow label and optional detail line."""
-    rprint(f"[yellow]Note:[/yellow] {message}")
+    _emit(f"[yellow]Note:[/yellow] {message}")
     if detail:
-        rprint(f"{_INDENT}{detail}")
+        _emit(f"{_INDENT}{detail}")
 
 
 def print_missing(message: str) -> None:
     """Print a missing/not-found item with yellow X."""
-    rprint(f"[yellow]✘[/yellow] {message}")
+    _emit(f"[yellow]✘[/yellow] {message}")
 
 
 def print_error_item(message: str, detail: str | None = None) -> None:
     """Print an error item with red X and optional detail line."""
-    rprint(f"[red]✘[/red] {message}")
+    _emit(f"[red]✘[/red] {message}")
     if detail:
-        rprint(f"{_INDENT}{detail}")
+        _emit(f"{_INDENT}{detail}")
 
 
 def print_info(message: str) -> None:
     """Print an info/neutral message with dim circle."""
-    rprint(f"[dim]○[/dim] {message}")
+    _emit(f"[dim]○[/dim] {message}")
 
 
 def print_detail(message: str) -> None:
     """Print an indented detail/continuation line."""
-    rprint(f"{_INDENT}{message}")
+    _emit(f"{_INDENT}{message}")
 
 
 def print_cancelled() -> None:
     """Print cancellation message."""
-    rprint("[yellow]Cancelled[/yellow]")
+    _emit("[yellow]Cancelled[/yellow]")
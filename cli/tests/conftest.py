@@ -0,0 +1,45 @@
+"""Shared pytest configuration for CLI tests."""
+
+import os
+from collections.abc import Iterator
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _zero_umask() -> Iterator[None]:  # pyright: ignore[reportUnusedFunction]  (autouse fixture)
+    # Permission bits are irrelevant for these throwaway files; a zero umask
+    # for the session skips per-create mode masking.
+    old = os.umask(0)
+    yield
+    _ = os.umask(old)
+
+
+# Set when pytest_configure picks a tmpfs basetemp, so pytest_unconfigure
+# only removes a tree this session created.
+_shm_basetemp: str | None = None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # These tests are filesystem-heavy (symlinks, many small writes), so put
+    # tmp_path on tmpfs when one is available instead of the checkout's disk.
+    # The pid suffix keeps concurrent runs from clearing each other's trees;
+    # the tree is removed again in pytest_unconfigure so runs don't pile up
+    # in RAM.
+    global _shm_basetemp
+    if (
+        config.option.basetemp is None
+        and os.path.isdir("/dev/shm")
+        and os.access("/dev/shm", os.W_OK)
+    ):
+        _shm_basetemp = f"/dev/shm/pytest-speculate-{os.getpid()}"
+        config.option.basetemp = _shm_basetemp
+
+
+def pytest_unconfigure() -> None:
+    # pluggy only passes the arguments a hook declares, so the unused
+    # config parameter is simply omitted.
+    if _shm_basetemp is not None:
+        import shutil
+
+        shutil.rmtree(_shm_basetemp, ignore_errors=True)
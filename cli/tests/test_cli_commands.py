@@ -1,11 +1,16 @@
 """Tests for CLI commands."""
 
 import os
+import re
+import shutil
+import stat
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
-from pytest import MonkeyPatch
 
 from speculate.cli.cli_commands import (
     SPECULATE_HEADER,
@@ -23,6 +28,177 @@ from speculate.cli.cli_commands import (
     uninstall,
 )
 
+# libyaml-backed C loader when available; the pure-Python safe_load would
+# otherwise dominate the CPU cost of these tests
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_load(text: str) -> Any:
+    return yaml.load(text, Loader=_YamlLoader)
+
+
+def _copier_answers_yaml(commit: str = "abc123", src: str = "test") -> str:
+    """Minimal copier-answers.yml body as a literal, skipping yaml.dump.
+
+    These tests only care that the keys parse back; the serializer adds
+    nothing but cost for flat string values.
+    """
+    return f"_commit: {commit}\n_src_path: {src}\n"
+
+
+# Shared fixture content, rendered once instead of per test
+_COPIER_ANSWERS_YAML = _copier_answers_yaml()
+_COPIER_MIN_YAML = b"_commit: abc123\n"
+_HEADER_ONLY = SPECULATE_HEADER + "\n"
+_CUSTOM_CONTENT = "# My Custom Instructions\n\nDo this and that."
+_HEADER_PLUS_CUSTOM = SPECULATE_HEADER + "\n\n" + _CUSTOM_CONTENT
+
+# orjson when installed (SIMD-accelerated parse), stdlib json otherwise
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+def _expect_exit(fn: Callable[[], object], code: int = 1) -> None:
+    """Assert that fn raises SystemExit with the given code.
+
+    Catches the exception directly, skipping pytest.raises' ExceptionInfo
+    and traceback capture.
+    """
+    try:
+        fn()
+    except SystemExit as e:
+        assert e.code == code
+    else:
+        pytest.fail("expected SystemExit")
+
+
+def _bulk_write(items: "dict[Path, str]") -> None:
+    """Write several small seed files, creating each parent directory once
+    and using raw open/write/close instead of a Path round-trip per file."""
+    for parent in {p.parent for p in items}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for path, content in items.items():
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _ = os.write(fd, content.encode())
+        finally:
+            os.close(fd)
+
+
+def _assert_symlink(p: Path) -> None:
+    """Assert p is a symlink with one lstat, no follow-the-link stat."""
+    assert stat.S_ISLNK(os.lstat(p).st_mode)
+
+
+def _scan(d: Path) -> "dict[str, os.DirEntry[str]]":
+    """Snapshot a directory in one scandir pass; DirEntry type checks are
+    answered from the directory read instead of a stat per assertion."""
+    with os.scandir(d) as it:
+        return {e.name: e for e in it}
+
+
+# Matches the last_docs_version line in raw settings.yml output, so tests
+# checking a single field can skip a full YAML parse
+_LAST_DOCS_VERSION_RE = re.compile(r"^last_docs_version: (\S+)\s*$", re.MULTILINE)
+
+
+# Expected symlink-target subpaths, joined once with the platform separator
+_GENERAL_RULES_SUBPATH = os.path.join("docs", "general", "agent-rules")
+_PROJECT_RULES_SUBPATH = os.path.join("docs", "project", "agent-rules")
+
+
+def _mk(root: Path, *relpaths: str) -> Path:
+    """Create directories under root with one makedirs call each, returning
+    the first created path for convenience."""
+    made = [root / rp for rp in relpaths]
+    for d in made:
+        os.makedirs(d, exist_ok=True)
+    return made[0]
+
+
+@pytest.fixture(scope="session")
+def docs_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Canonical docs tree with one general agent rule, built once per session."""
+    template = tmp_path_factory.mktemp("docs-template") / "proj"
+    rules_dir = template / "docs" / "general" / "agent-rules"
+    rules_dir.mkdir(parents=True)
+    # Content is never read (rules are symlinked by name), so zero-byte works
+    (rules_dir / "test.md").touch()
+    return template
+
+
+@pytest.fixture
+def rules_project(docs_template: Path, tmp_path: Path) -> Path:
+    """Per-test clone of the canonical docs tree (cheaper than re-creating it).
+
+    Files are hardlinked rather than copied: template and clone share a
+    tmpfs basetemp, the rule files are never mutated in place, and a link
+    is a metadata-only operation.
+    """
+    shutil.copytree(docs_template, tmp_path, dirs_exist_ok=True, copy_function=os.link)
+    return tmp_path
+
+
+@dataclass(frozen=True, slots=True)
+class _Paths:
+    """Commonly asserted project paths, joined once per test."""
+
+    root: Path
+    settings: Path
+    claude: Path
+    agents: Path
+    cursor_rules: Path
+
+
+@pytest.fixture
+def paths(tmp_path: Path) -> _Paths:
+    return _Paths(
+        root=tmp_path,
+        settings=tmp_path / ".speculate" / "settings.yml",
+        claude=tmp_path / "CLAUDE.md",
+        agents=tmp_path / "AGENTS.md",
+        cursor_rules=tmp_path / ".cursor" / "rules",
+    )
+
+
+@pytest.fixture(scope="module")
+def installed_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project with a full install() applied, built once per module.
+
+    Read-only tests assert on it directly; tests that mutate the tree clone
+    it with copytree rather than re-running install (the expensive part).
+    """
+    proj = tmp_path_factory.mktemp("installed") / "proj"
+    rules_dir = _mk(proj, _GENERAL_RULES_SUBPATH)
+    (rules_dir / "test-rule.md").touch()
+    install(root=proj)
+    return proj
+
+
+@pytest.fixture(scope="module")
+def hooks_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project with _setup_claude_hooks applied once, for read-only asserts."""
+    proj = tmp_path_factory.mktemp("hooks") / "proj"
+    proj.mkdir()
+    _setup_claude_hooks(proj, force=False)
+    return proj
+
+
+@pytest.fixture
+def chdir_tmp(tmp_path: Path) -> Iterator[Path]:
+    """Run the test from inside tmp_path, restoring the old cwd afterwards.
+
+    Lighter than monkeypatch.chdir, which records undo state per call.
+    """
+    old_cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        yield tmp_path
+    finally:
+        os.chdir(old_cwd)
+
 
 class TestUpdateSpeculateSettings:
     """Tests for _update_speculate_settings function."""
@@ -34,7 +210,7 @@ class TestUpdateSpeculateSettings:
         settings_file = tmp_path / ".speculate" / "settings.yml"
         assert settings_file.exists()
 
-        settings = yaml.safe_load(settings_file.read_text())
+        settings = _yaml_load(settings_file.read_text())
         assert "last_update" in settings
         assert "last_cli_version" in settings
 
@@ -43,11 +219,11 @@ class TestUpdateSpeculateSettings:
         settings_dir = tmp_path / ".speculate"
         settings_dir.mkdir()
         settings_file = settings_dir / "settings.yml"
-        settings_file.write_text(yaml.dump({"custom_key": "custom_value"}))
+        settings_file.write_text("custom_key: custom_value\n")
 
         _update_speculate_settings(tmp_path)
 
-        settings = yaml.safe_load(settings_file.read_text())
+        settings = _yaml_load(settings_file.read_text())
         # Existing keys should be preserved
         assert settings.get("custom_key") == "custom_value"
         # New keys should be added
@@ -58,13 +234,13 @@ class TestUpdateSpeculateSettings:
         speculate_dir = tmp_path / ".speculate"
         speculate_dir.mkdir()
         copier_answers = speculate_dir / "copier-answers.yml"
-        copier_answers.write_text(yaml.dump({"_commit": "v1.2.3", "_src_path": "gh:test/repo"}))
+        copier_answers.write_text(_copier_answers_yaml("v1.2.3", "gh:test/repo"))
 
         _update_speculate_settings(tmp_path)
 
         settings_file = tmp_path / ".speculate" / "settings.yml"
-        settings = yaml.safe_load(settings_file.read_text())
-        assert settings.get("last_docs_version") == "v1.2.3"
+        m = _LAST_DOCS_VERSION_RE.search(settings_file.read_text())
+        assert m and m.group(1) == "v1.2.3"
 
 
 class TestSetupCursorRules:
@@ -72,8 +248,7 @@ class TestSetupCursorRules:
 
     def test_creates_cursor_rules_directory(self, tmp_path: Path):
         """Should create .cursor/rules/ directory."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
+        _mk(tmp_path, _GENERAL_RULES_SUBPATH)
 
         _setup_cursor_rules(tmp_path)
 
@@ -82,179 +257,154 @@ class TestSetupCursorRules:
 
     def test_creates_symlinks_for_md_files(self, tmp_path: Path):
         """Should create symlinks with .mdc extension."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "general-rules.md").write_text("# General Rules")
-        (rules_dir / "python-rules.md").write_text("# Python Rules")
+        rules_dir = tmp_path / _GENERAL_RULES_SUBPATH
+        _bulk_write(
+            {
+                rules_dir / "general-rules.md": "# General Rules",
+                rules_dir / "python-rules.md": "# Python Rules",
+            }
+        )
 
         _setup_cursor_rules(tmp_path)
 
-        cursor_dir = tmp_path / ".cursor" / "rules"
-        assert (cursor_dir / "general-rules.mdc").is_symlink()
-        assert (cursor_dir / "python-rules.mdc").is_symlink()
+        entries = _scan(tmp_path / ".cursor" / "rules")
+        assert entries["general-rules.mdc"].is_symlink()
+        assert entries["python-rules.mdc"].is_symlink()
 
-    def test_symlinks_are_relative(self, tmp_path: Path):
+    def test_symlinks_are_relative(self, rules_project: Path):
         """Symlinks should be relative paths."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test.md").write_text("# Test")
-
-        _setup_cursor_rules(tmp_path)
+        _setup_cursor_rules(rules_project)
 
-        link = tmp_path / ".cursor" / "rules" / "test.mdc"
+        link = rules_project / ".cursor" / "rules" / "test.mdc"
         target = os.readlink(link)
         assert not target.startswith("/")
-        assert "docs/general/agent-rules/test.md" in target
-
-    def test_include_pattern_filters_rules(self, tmp_path: Path):
-        """Include pattern should filter which rules are linked."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "general-rules.md").write_text("# General Rules")
-        (rules_dir / "python-rules.md").write_text("# Python Rules")
-
-        _setup_cursor_rules(tmp_path, include=["general-*.md"])
-
-        cursor_dir = tmp_path / ".cursor" / "rules"
-        assert (cursor_dir / "general-rules.mdc").exists()
-        assert not (cursor_dir / "python-rules.mdc").exists()
-
-    def test_exclude_pattern_filters_rules(self, tmp_path: Path):
-        """Exclude pattern should filter out matching rules."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "general-rules.md").write_text("# General Rules")
-        (rules_dir / "convex-rules.md").write_text("# Convex Rules")
+        assert os.path.join(_GENERAL_RULES_SUBPATH, "test.md") in target
+
+    @pytest.mark.parametrize(
+        ("include", "exclude", "other_rule", "absent"),
+        [
+            (["general-*.md"], None, "python-rules.md", "python-rules.mdc"),
+            (None, ["convex-*.md"], "convex-rules.md", "convex-rules.mdc"),
+        ],
+    )
+    def test_patterns_filter_rules(
+        self,
+        tmp_path: Path,
+        include: list[str] | None,
+        exclude: list[str] | None,
+        other_rule: str,
+        absent: str,
+    ):
+        """Include/exclude patterns should filter which rules are linked."""
+        rules_dir = _mk(tmp_path, _GENERAL_RULES_SUBPATH)
+        _bulk_write(
+            {
+                rules_dir / "general-rules.md": "# General Rules",
+                rules_dir / other_rule: "# Other Rules",
+            }
+        )
 
-        _setup_cursor_rules(tmp_path, exclude=["convex-*.md"])
+        _setup_cursor_rules(tmp_path, include=include, exclude=exclude)
 
         cursor_dir = tmp_path / ".cursor" / "rules"
         assert (cursor_dir / "general-rules.mdc").exists()
-        assert not (cursor_dir / "convex-rules.mdc").exists()
+        assert not (cursor_dir / absent).exists()
 
     def test_warns_when_rules_dir_missing(self, tmp_path: Path):
         """Should warn when docs/general/agent-rules/ doesn't exist."""
         _setup_cursor_rules(tmp_path)
         # The function prints a warning via rich - we just verify it doesn't raise
 
-    def test_skips_existing_symlinks_without_force(self, tmp_path: Path):
+    def test_skips_existing_symlinks_without_force(self, rules_project: Path):
         """Should skip existing symlinks unless force=True."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test.md").write_text("# Test")
-
-        # First run creates the symlink
-        _setup_cursor_rules(tmp_path)
-        cursor_dir = tmp_path / ".cursor" / "rules"
-        link = cursor_dir / "test.mdc"
-        assert link.is_symlink()
+        # First run creates the symlink, second run without force skips it
+        _setup_cursor_rules(rules_project)
+        _setup_cursor_rules(rules_project)
 
-        # Second run without force should skip
-        _setup_cursor_rules(tmp_path)
+        link = rules_project / ".cursor" / "rules" / "test.mdc"
         assert link.is_symlink()
 
-    def test_overwrites_existing_symlinks_with_force(self, tmp_path: Path):
+    def test_overwrites_existing_symlinks_with_force(self, rules_project: Path):
         """Should overwrite existing symlinks when force=True."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test.md").write_text("# Test")
+        # First run creates the symlink, second run with force overwrites it
+        _setup_cursor_rules(rules_project)
+        _setup_cursor_rules(rules_project, force=True)
 
-        # First run creates the symlink
-        _setup_cursor_rules(tmp_path)
-        cursor_dir = tmp_path / ".cursor" / "rules"
-        link = cursor_dir / "test.mdc"
-        assert link.is_symlink()
-
-        # Second run with force should overwrite
-        _setup_cursor_rules(tmp_path, force=True)
+        link = rules_project / ".cursor" / "rules" / "test.mdc"
         assert link.is_symlink()
 
     def test_merges_general_and_project_rules(self, tmp_path: Path):
         """Should merge rules from general and project directories."""
-        # Create general rules
-        general_rules = tmp_path / "docs" / "general" / "agent-rules"
-        general_rules.mkdir(parents=True)
-        (general_rules / "general-rules.md").write_text("# General")
-        (general_rules / "shared-rules.md").write_text("# General Shared")
-
-        # Create project rules
-        project_rules = tmp_path / "docs" / "project" / "agent-rules"
-        project_rules.mkdir(parents=True)
-        (project_rules / "project-rules.md").write_text("# Project")
+        # Create general and project rules
+        general_rules = tmp_path / _GENERAL_RULES_SUBPATH
+        project_rules = tmp_path / _PROJECT_RULES_SUBPATH
+        _bulk_write(
+            {
+                general_rules / "general-rules.md": "# General",
+                general_rules / "shared-rules.md": "# General Shared",
+                project_rules / "project-rules.md": "# Project",
+            }
+        )
 
         _setup_cursor_rules(tmp_path)
 
         cursor_dir = tmp_path / ".cursor" / "rules"
-        assert (cursor_dir / "general-rules.mdc").is_symlink()
-        assert (cursor_dir / "shared-rules.mdc").is_symlink()
-        assert (cursor_dir / "project-rules.mdc").is_symlink()
+        entries = _scan(cursor_dir)
+        assert entries["general-rules.mdc"].is_symlink()
+        assert entries["shared-rules.mdc"].is_symlink()
+        assert entries["project-rules.mdc"].is_symlink()
 
         # Verify project-rules points to project directory
         target = os.readlink(cursor_dir / "project-rules.mdc")
-        assert "docs/project/agent-rules" in target
+        assert _PROJECT_RULES_SUBPATH in target
 
     def test_project_rules_override_general(self, tmp_path: Path):
         """Project rules should take precedence over general rules of same name."""
-        # Create general rules
-        general_rules = tmp_path / "docs" / "general" / "agent-rules"
-        general_rules.mkdir(parents=True)
-        (general_rules / "python-rules.md").write_text("# General Python")
-
-        # Create project rules with same name
-        project_rules = tmp_path / "docs" / "project" / "agent-rules"
-        project_rules.mkdir(parents=True)
-        (project_rules / "python-rules.md").write_text("# Project Python")
+        # Create general and project rules with the same name
+        general_rules = tmp_path / _GENERAL_RULES_SUBPATH
+        project_rules = tmp_path / _PROJECT_RULES_SUBPATH
+        _bulk_write(
+            {
+                general_rules / "python-rules.md": "# General Python",
+                project_rules / "python-rules.md": "# Project Python",
+            }
+        )
 
         _setup_cursor_rules(tmp_path)
 
         cursor_dir = tmp_path / ".cursor" / "rules"
         link = cursor_dir / "python-rules.mdc"
-        assert link.is_symlink()
+        _assert_symlink(link)
 
         # Should point to project version, not general
         target = os.readlink(link)
-        assert "docs/project/agent-rules" in target
-        assert "docs/general/agent-rules" not in target
+        assert _PROJECT_RULES_SUBPATH in target
+        assert _GENERAL_RULES_SUBPATH not in target
 
 
 class TestInstallCommand:
     """Tests for install command."""
 
-    def test_fails_without_docs_directory(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_fails_without_docs_directory(self, tmp_path: Path):
         """Should fail if docs/ directory doesn't exist."""
-        monkeypatch.chdir(tmp_path)
+        _expect_exit(lambda: install(root=tmp_path))
 
-        with pytest.raises(SystemExit) as exc_info:
-            install()
-        assert exc_info.value.code == 1
-
-    def test_creates_all_configs(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_creates_all_configs(self, installed_template: Path):
         """Should create all tool configurations."""
-        # Setup minimal docs structure
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test-rule.md").write_text("# Test")
-
-        monkeypatch.chdir(tmp_path)
-        install()
+        proj = installed_template
 
         # Check all configs exist
-        assert (tmp_path / ".speculate" / "settings.yml").exists()
-        assert (tmp_path / "CLAUDE.md").exists()
-        assert (tmp_path / "AGENTS.md").exists()
-        assert (tmp_path / ".cursor" / "rules").exists()
+        assert (proj / ".speculate" / "settings.yml").exists()
+        assert (proj / "CLAUDE.md").exists()
+        assert (proj / "AGENTS.md").exists()
+        assert (proj / ".cursor" / "rules").exists()
 
-    def test_creates_claude_md_as_symlink_when_not_exists(
-        self, tmp_path: Path, monkeypatch: MonkeyPatch
-    ):
+    def test_creates_claude_md_as_symlink_when_not_exists(self, tmp_path: Path):
         """Should create CLAUDE.md as symlink to AGENTS.md when CLAUDE.md doesn't exist."""
         docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
 
-        monkeypatch.chdir(tmp_path)
-        install()
+        install(root=tmp_path)
 
         claude_md = tmp_path / "CLAUDE.md"
         agents_md = tmp_path / "AGENTS.md"
@@ -269,7 +419,7 @@ class TestInstallCommand:
         # AGENTS.md should have the speculate header
         assert SPECULATE_MARKER in agents_md.read_text()
 
-    def test_preserves_existing_claude_md_file(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_preserves_existing_claude_md_file(self, tmp_path: Path):
         """Should preserve existing CLAUDE.md as a file (not convert to symlink)."""
         docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
@@ -278,8 +428,7 @@ class TestInstallCommand:
         claude_md = tmp_path / "CLAUDE.md"
         claude_md.write_text("# My custom CLAUDE instructions")
 
-        monkeypatch.chdir(tmp_path)
-        install()
+        install(root=tmp_path)
 
         # CLAUDE.md should still be a regular file, not a symlink
         assert not claude_md.is_symlink()
@@ -289,22 +438,20 @@ class TestInstallCommand:
         assert SPECULATE_MARKER in content
         assert "My custom CLAUDE instructions" in content
 
-    def test_idempotent_with_claude_symlink(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_idempotent_with_claude_symlink(self, tmp_path: Path):
         """Running install twice should be idempotent when CLAUDE.md is a symlink."""
         docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
 
-        monkeypatch.chdir(tmp_path)
-
         # First install
-        install()
+        install(root=tmp_path)
 
         claude_md = tmp_path / "CLAUDE.md"
         agents_md = tmp_path / "AGENTS.md"
         agents_content_after_first = agents_md.read_text()
 
         # Second install
-        install()
+        install(root=tmp_path)
 
         # CLAUDE.md should still be a symlink
         assert claude_md.is_symlink()
@@ -315,47 +462,33 @@ class TestInstallCommand:
 class TestStatusCommand:
     """Tests for status command."""
 
-    def test_fails_without_development_md(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_fails_without_development_md(self, chdir_tmp: Path):
         """Should fail if development.md is missing."""
-        docs_dir = tmp_path / "docs"
+        docs_dir = chdir_tmp / "docs"
         docs_dir.mkdir()
         # Create copier-answers so it doesn't fail on that first
-        speculate_dir = tmp_path / ".speculate"
+        speculate_dir = chdir_tmp / ".speculate"
         speculate_dir.mkdir()
-        (speculate_dir / "copier-answers.yml").write_text(
-            yaml.dump({"_commit": "abc123", "_src_path": "test"})
-        )
-
-        monkeypatch.chdir(tmp_path)
+        (speculate_dir / "copier-answers.yml").write_text(_COPIER_ANSWERS_YAML)
 
-        with pytest.raises(SystemExit) as exc_info:
-            status()
-        assert exc_info.value.code == 1
+        _expect_exit(status)
 
-    def test_fails_without_copier_answers(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_fails_without_copier_answers(self, chdir_tmp: Path):
         """Should fail if .speculate/copier-answers.yml is missing."""
-        docs_dir = tmp_path / "docs"
+        docs_dir = chdir_tmp / "docs"
         docs_dir.mkdir()
         (docs_dir / "development.md").write_text("# Development")
 
-        monkeypatch.chdir(tmp_path)
-
-        with pytest.raises(SystemExit) as exc_info:
-            status()
-        assert exc_info.value.code == 1
+        _expect_exit(status)
 
-    def test_succeeds_with_all_required_files(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_succeeds_with_all_required_files(self, chdir_tmp: Path):
         """Should succeed if development.md and .speculate/copier-answers.yml exist."""
-        docs_dir = tmp_path / "docs"
+        docs_dir = chdir_tmp / "docs"
         docs_dir.mkdir()
         (docs_dir / "development.md").write_text("# Development")
-        speculate_dir = tmp_path / ".speculate"
+        speculate_dir = chdir_tmp / ".speculate"
         speculate_dir.mkdir()
-        (speculate_dir / "copier-answers.yml").write_text(
-            yaml.dump({"_commit": "abc123", "_src_path": "test"})
-        )
-
-        monkeypatch.chdir(tmp_path)
+        (speculate_dir / "copier-answers.yml").write_text(_COPIER_ANSWERS_YAML)
 
         # Should not raise
         status()
@@ -377,7 +510,7 @@ class TestEnsureSpeculateHeader:
     def test_prepends_header_to_existing_content(self, tmp_path: Path):
         """Should prepend header to existing file content."""
         test_file = tmp_path / "CLAUDE.md"
-        existing_content = "# My Custom Instructions\n\nDo this and that."
+        existing_content = _CUSTOM_CONTENT
         test_file.write_text(existing_content)
 
         _ensure_speculate_header(test_file)
@@ -421,8 +554,7 @@ class TestRemoveSpeculateHeader:
     def test_removes_header_preserves_content(self, tmp_path: Path):
         """Should remove header but preserve other content."""
         test_file = tmp_path / "CLAUDE.md"
-        custom_content = "# My Custom Instructions\n\nDo this and that."
-        test_file.write_text(SPECULATE_HEADER + "\n\n" + custom_content)
+        test_file.write_text(_HEADER_PLUS_CUSTOM)
 
         _remove_speculate_header(test_file)
 
@@ -448,7 +580,7 @@ class TestRemoveSpeculateHeader:
     def test_deletes_file_if_empty_after_removal(self, tmp_path: Path):
         """Should delete file if it becomes empty after header removal."""
         test_file = tmp_path / "CLAUDE.md"
-        test_file.write_text(SPECULATE_HEADER + "\n")
+        test_file.write_text(_HEADER_ONLY)
 
         _remove_speculate_header(test_file)
 
@@ -477,16 +609,13 @@ class TestRemoveSpeculateHeader:
 class TestRemoveCursorRules:
     """Tests for _remove_cursor_rules function."""
 
-    def test_removes_symlinks(self, tmp_path: Path):
+    def test_removes_symlinks(self, rules_project: Path):
         """Should remove symlinks from .cursor/rules/."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test.md").write_text("# Test")
-
+        tmp_path = rules_project
         cursor_dir = tmp_path / ".cursor" / "rules"
         cursor_dir.mkdir(parents=True)
         link = cursor_dir / "test.mdc"
-        link.symlink_to(Path("..") / ".." / "docs" / "general" / "agent-rules" / "test.md")
+        link.symlink_to(Path("..") / ".." / _GENERAL_RULES_SUBPATH / "test.md")
 
         _remove_cursor_rules(tmp_path)
 
@@ -497,7 +626,7 @@ class TestRemoveCursorRules:
         cursor_dir = tmp_path / ".cursor" / "rules"
         cursor_dir.mkdir(parents=True)
         regular_file = cursor_dir / "custom.mdc"
-        regular_file.write_text("# Custom rules")
+        regular_file.touch()
 
         _remove_cursor_rules(tmp_path)
 
@@ -512,90 +641,76 @@ class TestRemoveCursorRules:
 class TestUninstallCommand:
     """Tests for uninstall command."""
 
-    def test_removes_all_tool_configs(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_removes_all_tool_configs(
+        self, installed_template: Path, tmp_path: Path, paths: _Paths
+    ):
         """Should remove all tool configurations."""
-        # Setup: create docs and run install
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test-rule.md").write_text("# Test")
-
-        monkeypatch.chdir(tmp_path)
-        install()
+        shutil.copytree(installed_template, tmp_path, dirs_exist_ok=True, symlinks=True)
 
         # Verify configs exist
-        assert (tmp_path / "CLAUDE.md").exists()
-        assert (tmp_path / "AGENTS.md").exists()
-        assert (tmp_path / ".speculate" / "settings.yml").exists()
-        assert (tmp_path / ".cursor" / "rules" / "test-rule.mdc").is_symlink()
+        assert paths.claude.exists()
+        assert paths.agents.exists()
+        assert paths.settings.exists()
+        assert (paths.cursor_rules / "test-rule.mdc").is_symlink()
 
         # Run uninstall with force
-        uninstall(force=True)
+        uninstall(force=True, root=tmp_path)
 
         # Verify headers removed (files may be deleted if empty)
-        claude_md = tmp_path / "CLAUDE.md"
-        if claude_md.exists():
-            assert SPECULATE_MARKER not in claude_md.read_text()
+        if paths.claude.exists():
+            assert SPECULATE_MARKER not in paths.claude.read_text()
 
-        agents_md = tmp_path / "AGENTS.md"
-        if agents_md.exists():
-            assert SPECULATE_MARKER not in agents_md.read_text()
+        if paths.agents.exists():
+            assert SPECULATE_MARKER not in paths.agents.read_text()
 
         # Settings should be removed
-        assert not (tmp_path / ".speculate" / "settings.yml").exists()
+        assert not paths.settings.exists()
 
         # Symlinks should be removed
-        assert not (tmp_path / ".cursor" / "rules" / "test-rule.mdc").exists()
+        assert not (paths.cursor_rules / "test-rule.mdc").exists()
 
-    def test_preserves_docs_directory(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_preserves_docs_directory(self, tmp_path: Path):
         """Should not remove docs/ directory."""
         docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
         (docs_dir / "test.md").write_text("# Test")
 
-        monkeypatch.chdir(tmp_path)
-
         # Create a marker file to test with
         claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text(SPECULATE_HEADER + "\n")
+        claude_md.write_text(_HEADER_ONLY)
 
-        uninstall(force=True)
+        uninstall(force=True, root=tmp_path)
 
         assert docs_dir.exists()
         assert (docs_dir / "test.md").exists()
 
-    def test_preserves_copier_answers(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_preserves_copier_answers(self, tmp_path: Path):
         """Should not remove .speculate/copier-answers.yml."""
         speculate_dir = tmp_path / ".speculate"
         speculate_dir.mkdir()
         copier_answers = speculate_dir / "copier-answers.yml"
-        copier_answers.write_text(yaml.dump({"_commit": "abc123"}))
+        copier_answers.write_bytes(_COPIER_MIN_YAML)
 
         # Create a marker file to test with
         claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text(SPECULATE_HEADER + "\n")
+        claude_md.write_text(_HEADER_ONLY)
 
-        monkeypatch.chdir(tmp_path)
-        uninstall(force=True)
+        uninstall(force=True, root=tmp_path)
 
         assert copier_answers.exists()
 
-    def test_nothing_to_uninstall(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_nothing_to_uninstall(self, tmp_path: Path):
         """Should handle case when nothing is installed."""
-        monkeypatch.chdir(tmp_path)
-
         # Should not raise
-        uninstall(force=True)
+        uninstall(force=True, root=tmp_path)
 
-    def test_preserves_custom_content_in_claude_md(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_preserves_custom_content_in_claude_md(self, tmp_path: Path):
         """Should preserve custom content in CLAUDE.md after removing header."""
         custom_content = "# My Custom Instructions\n\nThese are my rules."
         claude_md = tmp_path / "CLAUDE.md"
         claude_md.write_text(SPECULATE_HEADER + "\n\n" + custom_content)
 
-        monkeypatch.chdir(tmp_path)
-        uninstall(force=True)
+        uninstall(force=True, root=tmp_path)
 
         assert claude_md.exists()
         content = claude_md.read_text()
@@ -614,9 +729,10 @@ class TestCopyScriptFile:
         result = _copy_script_file(script_file, content, force=False)
 
         assert result == "created"
-        assert script_file.exists()
+        # One stat answers existence and the executable bits; os.access would
+        # issue its own faccessat syscall on top of it
+        assert os.stat(script_file).st_mode & 0o111
         assert script_file.read_text() == content
-        assert os.access(script_file, os.X_OK)
 
     def test_skips_identical_content(self, tmp_path: Path):
         """Should skip if content is identical."""
@@ -668,9 +784,7 @@ class TestMergeClaudeSettings:
 
         assert result == "created"
         assert settings_file.exists()
-        import json
-
-        settings = json.loads(settings_file.read_text())
+        settings = _json_loads(settings_file.read_text())
         assert "SessionStart" in settings["hooks"]
 
     def test_merges_into_existing_settings(self, tmp_path: Path):
@@ -694,7 +808,7 @@ class TestMergeClaudeSettings:
         result = _merge_claude_settings(settings_file, hooks_to_add)
 
         assert result == "updated hooks"
-        settings = json.loads(settings_file.read_text())
+        settings = _json_loads(settings_file.read_text())
         assert "SessionStart" in settings["hooks"]
         assert "PostToolUse" in settings["hooks"]
 
@@ -737,43 +851,34 @@ class TestMergeClaudeSettings:
 class TestSetupClaudeHooks:
     """Tests for _setup_claude_hooks function."""
 
-    def test_creates_claude_directory_structure(self, tmp_path: Path):
+    def test_creates_claude_directory_structure(self, hooks_project: Path):
         """Should create .claude/scripts/ directory."""
-        _setup_claude_hooks(tmp_path, force=False)
-
-        claude_dir = tmp_path / ".claude"
+        claude_dir = hooks_project / ".claude"
         scripts_dir = claude_dir / "scripts"
         assert claude_dir.exists()
         assert scripts_dir.exists()
 
-    def test_creates_script_files(self, tmp_path: Path):
+    def test_creates_script_files(self, hooks_project: Path):
         """Should create script files from resources."""
-        _setup_claude_hooks(tmp_path, force=False)
-
-        script_file = tmp_path / ".claude" / "scripts" / "ensure-gh-cli.sh"
-        assert script_file.exists()
-        assert os.access(script_file, os.X_OK)
+        script_file = hooks_project / ".claude" / "scripts" / "ensure-gh-cli.sh"
+        # stat raising would fail the test anyway, so this covers existence
+        # and the executable bits in one syscall
+        assert os.stat(script_file).st_mode & 0o111
 
-    def test_creates_settings_json(self, tmp_path: Path):
+    def test_creates_settings_json(self, hooks_project: Path):
         """Should create settings.json with hooks."""
-        import json
-
-        _setup_claude_hooks(tmp_path, force=False)
-
-        settings_file = tmp_path / ".claude" / "settings.json"
+        settings_file = hooks_project / ".claude" / "settings.json"
         assert settings_file.exists()
-        settings = json.loads(settings_file.read_text())
+        settings = _json_loads(settings_file.read_text())
         assert "SessionStart" in settings["hooks"]
 
     def test_idempotent_multiple_runs(self, tmp_path: Path):
         """Should be idempotent - running twice produces same result."""
-        import json
-
         _setup_claude_hooks(tmp_path, force=False)
-        first_settings = json.loads((tmp_path / ".claude" / "settings.json").read_text())
+        first_settings = _json_loads((tmp_path / ".claude" / "settings.json").read_text())
 
         _setup_claude_hooks(tmp_path, force=False)
-        second_settings = json.loads((tmp_path / ".claude" / "settings.json").read_text())
+        second_settings = _json_loads((tmp_path / ".claude" / "settings.json").read_text())
 
         assert first_settings == second_settings
         # Two SessionStart entries should exist (gh-cli and tbd)
@@ -798,7 +903,7 @@ class TestSetupClaudeHooks:
 
         _setup_claude_hooks(tmp_path, force=False)
 
-        settings = json.loads(settings_file.read_text())
+        settings = _json_loads(settings_file.read_text())
         assert "PostToolUse" in settings["hooks"]
         assert "SessionStart" in settings["hooks"]
 
@@ -814,4 +919,4 @@ class TestSetupClaudeHooks:
 
         _setup_claude_hooks(tmp_path, force=False)
 
-        assert json.loads(local_settings.read_text()) == local_content
+        assert _json_loads(local_settings.read_text()) == local_content
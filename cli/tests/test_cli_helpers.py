@@ -1,5 +1,6 @@
 """Tests for CLI helper functions."""
 
+import os
 from pathlib import Path
 
 from speculate.cli.cli_commands import (
@@ -10,6 +11,17 @@ from speculate.cli.cli_commands import (
 )
 
 
+def _mkfile(p: Path, data: bytes) -> None:
+    """Seed one file, creating parents with a single makedirs and writing
+    raw bytes (no pathlib flag parsing or text encoder)."""
+    os.makedirs(p.parent, exist_ok=True)
+    fd = os.open(p, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _ = os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 class TestGetDirStats:
     """Tests for _get_dir_stats function."""
 
@@ -21,18 +33,15 @@ class TestGetDirStats:
 
     def test_single_file(self, tmp_path: Path):
         """Single file should be counted correctly."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("hello")
+        _mkfile(tmp_path / "test.txt", b"hello")
         file_count, total_size = _get_dir_stats(tmp_path)
         assert file_count == 1
         assert total_size == 5
 
     def test_nested_files(self, tmp_path: Path):
         """Nested files should be counted recursively."""
-        (tmp_path / "file1.txt").write_text("abc")
-        subdir = tmp_path / "subdir"
-        subdir.mkdir()
-        (subdir / "file2.txt").write_text("defgh")
+        _mkfile(tmp_path / "file1.txt", b"abc")
+        _mkfile(tmp_path / "subdir" / "file2.txt", b"defgh")
         file_count, total_size = _get_dir_stats(tmp_path)
         assert file_count == 2
         assert total_size == 8